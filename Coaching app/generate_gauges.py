@@ -2,7 +2,123 @@
 Generate aviation-style gauge images for the coaching app
 """
 from PIL import Image, ImageDraw, ImageFont
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
 import math
+import os
+import sys
+
+# cos/sin for every tick angle used below (all are multiples of 10°) so the
+# tick loops don't recompute the same trig per gauge. Keyed by the raw angle
+# rather than angle % 360: cos/sin of e.g. 360° and 0° differ in the last bit,
+# which is enough to move a rasterized tick by a pixel
+_TRIG = {d: (math.cos(math.radians(d)), math.sin(math.radians(d))) for d in range(-360, 721, 10)}
+
+# Minor ticks every 10° with the major (every 30°) positions already left out,
+# so the tick code never visits or tests a major angle
+MINOR_STD = tuple(angle for angle in range(-120, 121, 10) if angle % 30 != 0)
+MINOR_FUEL = tuple(angle for angle in range(180, 361, 10) if angle % 30 != 0)
+MINOR_COMPASS = tuple(angle for angle in range(0, 360, 10) if angle % 30 != 0)
+# Fuel panel runs 270° to 90°, wrapping around through 0°
+MINOR_FUEL_PANEL = tuple(angle for angle in (*range(270, 360, 10), *range(0, 91, 10)) if angle % 30 != 0)
+
+# Output only depends on this file, so each PNG gets a sidecar .stamp holding a
+# hash of the generator source and is skipped while that matches (--force redraws)
+with open(__file__, 'rb') as _src:
+    SRC_HASH = hashlib.sha1(_src.read()).hexdigest()[:8]
+FORCE = '--force' in sys.argv
+
+# Gauges are drawn on a 400x400 canvas; GAUGE_SIZE picks the saved resolution
+# (resampled once on save) for when the UI shows them smaller than that
+CANVAS_SIZE = 400
+SIZE = int(os.environ.get('GAUGE_SIZE', CANVAS_SIZE))
+
+# Fast zlib level while iterating on the design; GAUGE_RELEASE=1 spends the
+# extra encode time on the smallest files before committing the images
+RELEASE = os.environ.get('GAUGE_RELEASE') == '1'
+PNG_OPTIONS = {'optimize': True} if RELEASE else {'optimize': False, 'compress_level': 1}
+
+def _to_palette(img):
+    """
+    Lossless palette ('P') copy of an RGBA gauge, or None if it won't fit
+    Gauges are opaque shapes on a fully transparent background, so up to 255
+    opaque colors keep their exact values (median cut gives every color its
+    own entry when there are fewer than requested) and entry 255 is the
+    transparent background.
+    """
+    alpha = img.getchannel('A')
+    if any(a not in (0, 255) for _, a in alpha.getcolors(256)):
+        return None
+    rgb = img.convert('RGB')
+    if rgb.getcolors(255) is None:
+        return None
+    pal = rgb.quantize(colors=255, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+    palette = pal.getpalette()[:255 * 3]
+    pal.putpalette(palette + [0] * (255 * 3 - len(palette)) + [255, 255, 255])
+    pal.paste(255, mask=alpha.point(lambda a: 255 - a))
+    pal.info['transparency'] = 255
+    return pal
+
+# Pillow releases the GIL while quantizing and deflating, so saves run on a
+# small thread pool while the caller goes on to draw its next gauge
+_io_pool = ThreadPoolExecutor(max_workers=2)
+_pending_saves = []
+
+def _write_png(img, filename, stamp, stamp_value):
+    if SIZE != CANVAS_SIZE:
+        img = img.resize((SIZE, SIZE), Image.LANCZOS)
+    img = _to_palette(img) or img
+    img.save(filename, 'PNG', **PNG_OPTIONS)
+    with open(stamp, 'w') as f:
+        f.write(stamp_value)
+
+def _save(img, filename):
+    """Queue img to be saved as a PNG unless it is already current; returns True if queued"""
+    stamp = filename + '.stamp'
+    stamp_value = f"{SRC_HASH}-{SIZE}-{'release' if RELEASE else 'fast'}"
+    if not FORCE and os.path.exists(filename) and os.path.exists(stamp):
+        with open(stamp) as f:
+            if f.read() == stamp_value:
+                print(f"Up to date: {filename}")
+                return False
+    _pending_saves.append(_io_pool.submit(_write_png, img, filename, stamp, stamp_value))
+    return True
+
+def _flush_saves():
+    """Wait for every queued save, re-raising any error from writing it"""
+    while _pending_saves:
+        _pending_saves.pop(0).result()
+
+def _polar(angles, radius, center=200):
+    """Return the (x, y) point at radius from center for each angle (degrees)"""
+    trig = _TRIG
+    points = []
+    append = points.append
+    for angle in angles:
+        c, s = trig[angle]
+        append((center + radius * c, center + radius * s))
+    return points
+
+def _tick_lines(angles, inner, outer, center=200):
+    """Return [x1, y1, x2, y2] tick endpoints between two radii for each angle"""
+    return [[x1, y1, x2, y2] for (x1, y1), (x2, y2)
+            in zip(_polar(angles, inner, center), _polar(angles, outer, center))]
+
+@lru_cache(maxsize=None)
+def _tick_overlay(major_angles, minor_angles, major_color, minor_color, outer_radius=180, center=200):
+    """
+    Transparent layer with every major and minor tick line of one gauge style
+    Built once per style and alpha-composited, so gauges sharing a tick
+    layout (thrust and the standard gauges) don't redraw the lines.
+    """
+    overlay = Image.new('RGBA', (center * 2, center * 2), (0, 0, 0, 0))
+    draw_line = ImageDraw.Draw(overlay).line
+    for line in _tick_lines(major_angles, outer_radius - 25, outer_radius - 10, center):
+        draw_line(line, fill=major_color, width=3)
+    for line in _tick_lines(minor_angles, outer_radius - 20, outer_radius - 10, center):
+        draw_line(line, fill=minor_color, width=2)
+    return overlay
 
 def create_gauge(filename, gauge_type='standard', title='', subtitle=''):
     """
@@ -44,42 +160,24 @@ def create_gauge(filename, gauge_type='standard', title='', subtitle=''):
         angles = range(start_angle, end_angle + 1, 30)
         labels = ['0', '', '', '', '50', '', '', '', '100']
 
-    # Draw tick marks
-    for i, angle in enumerate(angles):
-        angle_rad = math.radians(angle)
-
-        # Major tick
-        x1 = center + (outer_radius - 25) * math.cos(angle_rad)
-        y1 = center + (outer_radius - 25) * math.sin(angle_rad)
-        x2 = center + (outer_radius - 10) * math.cos(angle_rad)
-        y2 = center + (outer_radius - 10) * math.sin(angle_rad)
-        draw.line([x1, y1, x2, y2], fill='#e94560', width=3)
-
-        # Draw labels
-        if i < len(labels) and labels[i]:
-            label_x = center + (outer_radius - 45) * math.cos(angle_rad)
-            label_y = center + (outer_radius - 45) * math.sin(angle_rad)
-            # Simple text without font
-            bbox = draw.textbbox((label_x, label_y), labels[i], anchor='mm')
-            draw.text((label_x, label_y), labels[i], fill='#ffffff', anchor='mm')
-
-    # Draw minor tick marks
-    minor_angles = []
+    # Minor tick marks
     if gauge_type == 'fuel':
-        minor_angles = range(180, 361, 10)
+        minor_angles = MINOR_FUEL
     elif gauge_type == 'compass':
-        minor_angles = range(0, 360, 10)
+        minor_angles = MINOR_COMPASS
     else:
-        minor_angles = range(-120, 121, 10)
+        minor_angles = MINOR_STD
 
-    for angle in minor_angles:
-        if angle not in angles:  # Skip major ticks
-            angle_rad = math.radians(angle)
-            x1 = center + (outer_radius - 20) * math.cos(angle_rad)
-            y1 = center + (outer_radius - 20) * math.sin(angle_rad)
-            x2 = center + (outer_radius - 10) * math.cos(angle_rad)
-            y2 = center + (outer_radius - 10) * math.sin(angle_rad)
-            draw.line([x1, y1, x2, y2], fill='#533483', width=2)
+    # Draw major and minor tick marks
+    img.alpha_composite(_tick_overlay(tuple(angles), minor_angles, '#e94560', '#533483', outer_radius, center))
+
+    # Draw labels
+    label_points = _polar(angles, outer_radius - 45, center)
+    draw_text = draw.text
+    for i, point in enumerate(label_points):
+        if i < len(labels) and labels[i]:
+            # Simple text without font
+            draw_text(point, labels[i], fill='#ffffff', anchor='mm')
 
     # Center hub
     draw.ellipse([center-15, center-15, center+15, center+15], fill='#2d2d44', outline='#e94560', width=2)
@@ -91,90 +189,100 @@ def create_gauge(filename, gauge_type='standard', title='', subtitle=''):
         draw.text((center, 320), subtitle, fill='#aaaaaa', anchor='mm')
 
     # Save image
-    img.save(filename, 'PNG')
-    print(f"Created {filename}")
+    if _save(img, filename):
+        print(f"Created {filename}")
+
+# Thrust and standard gauges use the standard -120° to +120° ticks rotated
+# 90° CCW and then 180° more (+270° total)
+_ROTATED_MAJOR = tuple(angle + 90 + 180 for angle in range(-120, 121, 30))
+_ROTATED_MINOR = tuple(angle + 90 + 180 for angle in MINOR_STD)
+
+# White face with red/yellow/green zones, the first layer of the thrust and
+# standard gauges
+@lru_cache(maxsize=None)
+def _color_zone_face():
+    img = Image.new('RGBA', (400, 400), (255, 255, 255, 0))
+    draw = ImageDraw.Draw(img)
 
-# Create all gauge images
-print("Generating gauge images...")
+    # White background circle
+    draw.ellipse([20, 20, 380, 380], fill='#ffffff', outline='#cccccc', width=3)
 
-# Standard gauges will be custom with white background and color zones
-# (Engine, Positive, Weight, Negative)
+    # Draw colored arc zones BEFORE the inner circle (rotated 90° counter-clockwise from standard gauge)
+    # Standard gauge goes from -120° to +120° (240° arc)
+    # After 90° CCW rotation: -120° becomes -210° (= 150°), +120° becomes 30°
+    # So the arc now spans from 150° to 30° (going clockwise through top)
 
-# Thrust gauge (240° arc rotated 90° CCW) - WHITE BACKGROUND with COLOR ZONES
-img = Image.new('RGBA', (400, 400), (255, 255, 255, 0))
-draw = ImageDraw.Draw(img)
-center = 200
-outer_radius = 180
+    # Red zone: 0-33% (150° to 230°)
+    draw.pieslice([60, 60, 340, 340], start=150, end=230, fill='#fca5a5', outline='#dc2626', width=2)
 
-# White background circle
-draw.ellipse([20, 20, 380, 380], fill='#ffffff', outline='#cccccc', width=3)
+    # Yellow zone: 34-66% (230° to 310°)
+    draw.pieslice([60, 60, 340, 340], start=230, end=310, fill='#fde68a', outline='#fbbf24', width=2)
 
-# Draw colored arc zones BEFORE the inner circle (rotated 90° counter-clockwise from standard gauge)
-# Standard gauge goes from -120° to +120° (240° arc)
-# After 90° CCW rotation: -120° becomes -210° (= 150°), +120° becomes 30°
-# So the arc now spans from 150° to 30° (going clockwise through top)
+    # Green zone: 67-100% (310° to 30°, wrapping through 0°)
+    draw.pieslice([60, 60, 340, 340], start=310, end=390, fill='#bbf7d0', outline='#22c55e', width=2)
 
-# Red zone: 0-33% (150° to 230°)
-draw.pieslice([60, 60, 340, 340], start=150, end=230, fill='#fca5a5', outline='#dc2626', width=2)
+    # Inner gauge face - white (covers the center, leaving colored ring visible)
+    draw.ellipse([100, 100, 300, 300], fill='#ffffff', outline='#cccccc', width=2)
 
-# Yellow zone: 34-66% (230° to 310°)
-draw.pieslice([60, 60, 340, 340], start=230, end=310, fill='#fde68a', outline='#fbbf24', width=2)
+    return img
 
-# Green zone: 67-100% (310° to 30°, wrapping through 0°)
-draw.pieslice([60, 60, 340, 340], start=310, end=390, fill='#bbf7d0', outline='#22c55e', width=2)
+# The thrust and standard gauges only differ in their title/subtitle, so the
+# body (background, color zones, ticks, hub) is drawn once and copied per gauge
+@lru_cache(maxsize=None)
+def _standard_template():
+    # White background, color zones and inner face
+    img = _color_zone_face().copy()
+    draw = ImageDraw.Draw(img)
+    center = 200
+    outer_radius = 180
 
-# Inner gauge face - white (covers the center, leaving colored ring visible)
-draw.ellipse([100, 100, 300, 300], fill='#ffffff', outline='#cccccc', width=2)
+    # Draw tick marks for thrust/standard gauges (rotated 90° CCW + 180° = 270° total = -90°)
+    # Original: -120° to +120°
+    # After 90° CCW rotation: add 90°
+    # After additional 180° rotation: add another 180° (total: +270° or -90°)
+    labels = ['0', '', '', '', '50', '', '', '', '100']
 
-# Draw tick marks for thrust gauge (rotated 90° CCW + 180° = 270° total = -90°)
-# Original: -120° to +120°
-# After 90° CCW rotation: add 90°
-# After additional 180° rotation: add another 180° (total: +270° or -90°)
-angles_original = range(-120, 121, 30)
-labels = ['0', '', '', '', '50', '', '', '', '100']
+    # Major and minor tick marks
+    img.alpha_composite(_tick_overlay(_ROTATED_MAJOR, _ROTATED_MINOR, '#000000', '#666666', outer_radius, center))
 
-# Draw major tick marks
-for i, angle_orig in enumerate(angles_original):
-    angle = angle_orig + 90 + 180  # Rotate 90° CCW then 180° more
-    angle_rad = math.radians(angle)
+    draw_text = draw.text
+    for i, point in enumerate(_polar(_ROTATED_MAJOR, outer_radius - 45, center)):
+        if i < len(labels) and labels[i]:
+            draw_text(point, labels[i], fill='#000000', anchor='mm')
 
-    # Major tick
-    x1 = center + (outer_radius - 25) * math.cos(angle_rad)
-    y1 = center + (outer_radius - 25) * math.sin(angle_rad)
-    x2 = center + (outer_radius - 10) * math.cos(angle_rad)
-    y2 = center + (outer_radius - 10) * math.sin(angle_rad)
-    draw.line([x1, y1, x2, y2], fill='#000000', width=3)
+    # Center hub
+    draw.ellipse([center-15, center-15, center+15, center+15], fill='#cccccc', outline='#000000', width=2)
 
-    # Draw labels
-    if i < len(labels) and labels[i]:
-        label_x = center + (outer_radius - 45) * math.cos(angle_rad)
-        label_y = center + (outer_radius - 45) * math.sin(angle_rad)
-        draw.text((label_x, label_y), labels[i], fill='#000000', anchor='mm')
-
-# Draw minor tick marks (rotated 90° CCW + 180°)
-minor_angles_original = range(-120, 121, 10)
-for angle_orig in minor_angles_original:
-    angle = angle_orig + 90 + 180  # Rotate 90° CCW then 180° more
-    if angle_orig not in angles_original:  # Skip major ticks
-        angle_rad = math.radians(angle)
-        x1 = center + (outer_radius - 20) * math.cos(angle_rad)
-        y1 = center + (outer_radius - 20) * math.sin(angle_rad)
-        x2 = center + (outer_radius - 10) * math.cos(angle_rad)
-        y2 = center + (outer_radius - 10) * math.sin(angle_rad)
-        draw.line([x1, y1, x2, y2], fill='#666666', width=2)
-
-# Title text
-draw.text((center, 70), 'THRUST', fill='#000000', anchor='mm')
-draw.text((center, 330), 'Power', fill='#666666', anchor='mm')
-
-# Center hub
-draw.ellipse([center-15, center-15, center+15, center+15], fill='#cccccc', outline='#000000', width=2)
-
-img.save('images/thrust-gauge.png', 'PNG')
-print("Created images/thrust-gauge.png (white background with color zones, rotated 90° CCW)")
+    return img
 
 # Helper function to create standard gauge with color zones
 def create_standard_color_gauge(filename, title, subtitle):
+    img = _standard_template().copy()
+    draw = ImageDraw.Draw(img)
+
+    # Title text
+    draw.text((200, 70), title, fill='#000000', anchor='mm')
+    draw.text((200, 330), subtitle, fill='#666666', anchor='mm')
+
+    if _save(img, filename):
+        print(f"Created {filename} (white background with color zones)")
+
+# Gauges built on the standard body: (image name, title, subtitle)
+STANDARD_GAUGES = [
+    ('thrust', 'THRUST', 'Power'),  # 240° arc rotated 90° CCW
+    ('engine', 'ENGINE', 'Condition'),
+    ('positive', 'POSITIVE', 'Emotion'),
+    ('weight', 'WEIGHT', 'Balance'),
+    ('negative', 'NEGATIVE', 'Stress'),
+]
+
+def create_standard_color_gauges(specs):
+    """Create every gauge in specs in one go so they all share one standard body"""
+    for key, title, subtitle in specs:
+        create_standard_color_gauge(f'images/{key}-gauge.png', title, subtitle)
+
+def create_fuel_gauge(filename, title, subtitle):
+    """Fuel gauge (180° semicircle) - white background with black fuel icon"""
     img = Image.new('RGBA', (400, 400), (255, 255, 255, 0))
     draw = ImageDraw.Draw(img)
     center = 200
@@ -183,190 +291,126 @@ def create_standard_color_gauge(filename, title, subtitle):
     # White background circle
     draw.ellipse([20, 20, 380, 380], fill='#ffffff', outline='#cccccc', width=3)
 
-    # Draw colored arc zones (rotated 90° CCW + 180°)
-    # Red zone: 0-33%
-    draw.pieslice([60, 60, 340, 340], start=150, end=230, fill='#fca5a5', outline='#dc2626', width=2)
-    # Yellow zone: 34-66%
-    draw.pieslice([60, 60, 340, 340], start=230, end=310, fill='#fde68a', outline='#fbbf24', width=2)
-    # Green zone: 67-100%
-    draw.pieslice([60, 60, 340, 340], start=310, end=390, fill='#bbf7d0', outline='#22c55e', width=2)
+    # Draw colored arc zones BEFORE the inner circle (rotated 90° counter-clockwise)
+    # Green zone: 67-100% (270° to 330°) - Full at left
+    draw.pieslice([60, 60, 340, 340], start=270, end=330, fill='#bbf7d0', outline='#22c55e', width=2)
 
-    # Inner gauge face - white
-    draw.ellipse([100, 100, 300, 300], fill='#ffffff', outline='#cccccc', width=2)
+    # Yellow zone: 34-66% (330° to 390° = 330° to 30°) - Middle
+    draw.pieslice([60, 60, 340, 340], start=330, end=30, fill='#fde68a', outline='#fbbf24', width=2)
 
-    # Draw tick marks (rotated 90° CCW + 180°)
-    angles_original = range(-120, 121, 30)
-    labels = ['0', '', '', '', '50', '', '', '', '100']
+    # Red zone: 0-33% (30° to 90°) - Empty at right
+    draw.pieslice([60, 60, 340, 340], start=30, end=90, fill='#fca5a5', outline='#dc2626', width=2)
 
-    # Major tick marks
-    for i, angle_orig in enumerate(angles_original):
-        angle = angle_orig + 90 + 180
-        angle_rad = math.radians(angle)
-
-        x1 = center + (outer_radius - 25) * math.cos(angle_rad)
-        y1 = center + (outer_radius - 25) * math.sin(angle_rad)
-        x2 = center + (outer_radius - 10) * math.cos(angle_rad)
-        y2 = center + (outer_radius - 10) * math.sin(angle_rad)
-        draw.line([x1, y1, x2, y2], fill='#000000', width=3)
-
-        if i < len(labels) and labels[i]:
-            label_x = center + (outer_radius - 45) * math.cos(angle_rad)
-            label_y = center + (outer_radius - 45) * math.sin(angle_rad)
-            draw.text((label_x, label_y), labels[i], fill='#000000', anchor='mm')
-
-    # Minor tick marks
-    minor_angles_original = range(-120, 121, 10)
-    for angle_orig in minor_angles_original:
-        angle = angle_orig + 90 + 180
-        if angle_orig not in angles_original:
-            angle_rad = math.radians(angle)
-            x1 = center + (outer_radius - 20) * math.cos(angle_rad)
-            y1 = center + (outer_radius - 20) * math.sin(angle_rad)
-            x2 = center + (outer_radius - 10) * math.cos(angle_rad)
-            y2 = center + (outer_radius - 10) * math.sin(angle_rad)
-            draw.line([x1, y1, x2, y2], fill='#666666', width=2)
-
-    # Title text
-    draw.text((center, 70), title, fill='#000000', anchor='mm')
-    draw.text((center, 330), subtitle, fill='#666666', anchor='mm')
+    # Inner gauge face - white (covers the center, leaving colored ring visible)
+    draw.ellipse([100, 100, 300, 300], fill='#ffffff', outline='#cccccc', width=2)
 
-    # Center hub
-    draw.ellipse([center-15, center-15, center+15, center+15], fill='#cccccc', outline='#000000', width=2)
+    # Draw tick marks for fuel gauge (270° to 90° = -90° to 90°)
+    start_angle = 270  # Left side
+    end_angle = 90     # Right side (goes through top: 270->360->0->90)
+    angles = (270, 300, 330, 0, 30, 60, 90)
+    labels = ['F', '', '', '', '', '', 'E']
 
-    img.save(filename, 'PNG')
-    print(f"Created {filename} (white background with color zones)")
+    # Draw major and minor tick marks (minor ticks 270° to 90°, wrapping around)
+    img.alpha_composite(_tick_overlay(angles, MINOR_FUEL_PANEL, '#000000', '#666666', outer_radius, center))
 
-# Create the four standard gauges with color zones
-create_standard_color_gauge('images/engine-gauge.png', 'ENGINE', 'Condition')
-create_standard_color_gauge('images/positive-gauge.png', 'POSITIVE', 'Emotion')
-create_standard_color_gauge('images/weight-gauge.png', 'WEIGHT', 'Balance')
-create_standard_color_gauge('images/negative-gauge.png', 'NEGATIVE', 'Stress')
+    # Draw labels
+    draw_text = draw.text
+    for i, point in enumerate(_polar(angles, outer_radius - 45, center)):
+        if i < len(labels) and labels[i]:
+            draw_text(point, labels[i], fill='#000000', anchor='mm')
 
-# Fuel gauge (180° semicircle) - WHITE BACKGROUND with BLACK FUEL ICON
-img = Image.new('RGBA', (400, 400), (255, 255, 255, 0))
-draw = ImageDraw.Draw(img)
-center = 200
-outer_radius = 180
+    # Draw fuel pump icon on the left side (will be colored dynamically in JavaScript)
+    # Position: left of center
+    pump_x = center - 60  # Move left
+    pump_y = center - 10   # Move up slightly
 
-# White background circle
-draw.ellipse([20, 20, 380, 380], fill='#ffffff', outline='#cccccc', width=3)
+    # Note: Icon will be black by default, JavaScript will change color based on fuel level
+    # Fuel pump body (rectangle)
+    draw.rectangle([pump_x-20, pump_y-25, pump_x+20, pump_y+25], fill='#666666', outline='#333333')
 
-# Draw colored arc zones BEFORE the inner circle (rotated 90° counter-clockwise)
-# Green zone: 67-100% (270° to 330°) - Full at left
-draw.pieslice([60, 60, 340, 340], start=270, end=330, fill='#bbf7d0', outline='#22c55e', width=2)
+    # Fuel pump nozzle/hose
+    draw.rectangle([pump_x-25, pump_y-15, pump_x-20, pump_y-5], fill='#666666', outline='#333333')
 
-# Yellow zone: 34-66% (330° to 390° = 330° to 30°) - Middle
-draw.pieslice([60, 60, 340, 340], start=330, end=30, fill='#fde68a', outline='#fbbf24', width=2)
+    # Fuel pump display screen (white rectangle on pump)
+    draw.rectangle([pump_x-12, pump_y-15, pump_x+12, pump_y-5], fill='#ffffff', outline='#333333', width=1)
 
-# Red zone: 0-33% (30° to 90°) - Empty at right
-draw.pieslice([60, 60, 340, 340], start=30, end=90, fill='#fca5a5', outline='#dc2626', width=2)
+    # Fuel droplet icon
+    droplet_top_x = pump_x
+    droplet_top_y = pump_y + 5
+    draw.ellipse([droplet_top_x-6, droplet_top_y, droplet_top_x+6, droplet_top_y+12], fill='#666666')
+    draw.polygon([(droplet_top_x, droplet_top_y-8), (droplet_top_x-6, droplet_top_y), (droplet_top_x+6, droplet_top_y)], fill='#666666')
 
-# Inner gauge face - white (covers the center, leaving colored ring visible)
-draw.ellipse([100, 100, 300, 300], fill='#ffffff', outline='#cccccc', width=2)
+    # Title text
+    draw.text((center, 70), title, fill='#000000', anchor='mm')
+    draw.text((center, 330), subtitle, fill='#666666', anchor='mm')
 
-# Draw tick marks for fuel gauge (270° to 90° = -90° to 90°)
-start_angle = 270  # Left side
-end_angle = 90     # Right side (goes through top: 270->360->0->90)
-angles = [270, 300, 330, 0, 30, 60, 90]
-labels = ['F', '', '', '', '', '', 'E']
+    # Center hub (will be covered by needle center)
+    draw.ellipse([center-15, center-15, center+15, center+15], fill='#cccccc', outline='#000000', width=2)
 
-# Draw major tick marks
-for i, angle in enumerate(angles):
-    angle_rad = math.radians(angle)
+    if _save(img, filename):
+        print(f"Created {filename} (white background with black fuel icon)")
 
-    # Major tick
-    x1 = center + (outer_radius - 25) * math.cos(angle_rad)
-    y1 = center + (outer_radius - 25) * math.sin(angle_rad)
-    x2 = center + (outer_radius - 10) * math.cos(angle_rad)
-    y2 = center + (outer_radius - 10) * math.sin(angle_rad)
-    draw.line([x1, y1, x2, y2], fill='#000000', width=3)
+def create_horizon_gauge(filename, title, subtitle):
+    """Horizon gauge (special - shows level)"""
+    img = Image.new('RGBA', (400, 400), (255, 255, 255, 0))
+    draw = ImageDraw.Draw(img)
+    center = 200
 
-    # Draw labels
-    if i < len(labels) and labels[i]:
-        label_x = center + (outer_radius - 45) * math.cos(angle_rad)
-        label_y = center + (outer_radius - 45) * math.sin(angle_rad)
-        draw.text((label_x, label_y), labels[i], fill='#000000', anchor='mm')
-
-# Draw minor tick marks (270° to 90°, wrapping around)
-minor_angles = list(range(270, 360, 10)) + list(range(0, 91, 10))
-for angle in minor_angles:
-    if angle not in angles:  # Skip major ticks
-        angle_rad = math.radians(angle)
-        x1 = center + (outer_radius - 20) * math.cos(angle_rad)
-        y1 = center + (outer_radius - 20) * math.sin(angle_rad)
-        x2 = center + (outer_radius - 10) * math.cos(angle_rad)
-        y2 = center + (outer_radius - 10) * math.sin(angle_rad)
-        draw.line([x1, y1, x2, y2], fill='#666666', width=2)
-
-# Draw fuel pump icon on the left side (will be colored dynamically in JavaScript)
-# Position: left of center
-pump_x = center - 60  # Move left
-pump_y = center - 10   # Move up slightly
-
-# Note: Icon will be black by default, JavaScript will change color based on fuel level
-# Fuel pump body (rectangle)
-draw.rectangle([pump_x-20, pump_y-25, pump_x+20, pump_y+25], fill='#666666', outline='#333333')
-
-# Fuel pump nozzle/hose
-draw.rectangle([pump_x-25, pump_y-15, pump_x-20, pump_y-5], fill='#666666', outline='#333333')
-
-# Fuel pump display screen (white rectangle on pump)
-draw.rectangle([pump_x-12, pump_y-15, pump_x+12, pump_y-5], fill='#ffffff', outline='#333333', width=1)
-
-# Fuel droplet icon
-droplet_top_x = pump_x
-droplet_top_y = pump_y + 5
-draw.ellipse([droplet_top_x-6, droplet_top_y, droplet_top_x+6, droplet_top_y+12], fill='#666666')
-draw.polygon([(droplet_top_x, droplet_top_y-8), (droplet_top_x-6, droplet_top_y), (droplet_top_x+6, droplet_top_y)], fill='#666666')
-
-# Title text
-draw.text((center, 70), 'FUEL', fill='#000000', anchor='mm')
-draw.text((center, 330), 'Energy Level', fill='#666666', anchor='mm')
-
-# Center hub (will be covered by needle center)
-draw.ellipse([center-15, center-15, center+15, center+15], fill='#cccccc', outline='#000000', width=2)
-
-img.save('images/fuel-gauge.png', 'PNG')
-print("Created images/fuel-gauge.png (white background with black fuel icon)")
-
-# Compass gauges (360° full circle)
-create_gauge('images/compass-gauge.png', 'compass', 'COMPASS', 'Direction')
-
-# Horizon gauge (special - shows level)
-img = Image.new('RGBA', (400, 400), (255, 255, 255, 0))
-draw = ImageDraw.Draw(img)
-center = 200
-
-# Background
-draw.ellipse([20, 20, 380, 380], fill='#1a1a2e', outline='#0f3460', width=3)
-
-# Sky (blue top half)
-draw.pieslice([60, 60, 340, 340], start=180, end=360, fill='#0066cc', outline='#0f3460')
-
-# Ground (brown bottom half)
-draw.pieslice([60, 60, 340, 340], start=0, end=180, fill='#8b4513', outline='#0f3460')
-
-# Horizon line
-draw.line([60, center, 340, center], fill='#ffffff', width=3)
-
-# Center aircraft symbol
-draw.line([center-40, center, center-20, center], fill='#ffff00', width=4)
-draw.line([center+20, center, center+40, center], fill='#ffff00', width=4)
-draw.ellipse([center-8, center-8, center+8, center+8], fill='#ffff00', outline='#ff8800', width=2)
-
-# Tick marks
-for i in range(-30, 31, 10):
-    y = center + i * 2
-    if i != 0:
-        draw.line([80, y, 100, y], fill='#ffffff', width=2)
-        draw.line([300, y, 320, y], fill='#ffffff', width=2)
-
-# Title
-draw.text((center, 80), 'HORIZON', fill='#ffffff', anchor='mm')
-draw.text((center, 320), 'Attitude', fill='#aaaaaa', anchor='mm')
-
-img.save('images/horizon-gauge.png', 'PNG')
-print("Created images/horizon-gauge.png")
-
-print("\nAll gauge images generated successfully!")
-print("Images are saved in the 'images' folder")
+    # Background
+    draw.ellipse([20, 20, 380, 380], fill='#1a1a2e', outline='#0f3460', width=3)
+
+    # Sky (blue top half)
+    draw.pieslice([60, 60, 340, 340], start=180, end=360, fill='#0066cc', outline='#0f3460')
+
+    # Ground (brown bottom half)
+    draw.pieslice([60, 60, 340, 340], start=0, end=180, fill='#8b4513', outline='#0f3460')
+
+    # Horizon line
+    draw.line([60, center, 340, center], fill='#ffffff', width=3)
+
+    # Center aircraft symbol
+    draw.line([center-40, center, center-20, center], fill='#ffff00', width=4)
+    draw.line([center+20, center, center+40, center], fill='#ffff00', width=4)
+    draw.ellipse([center-8, center-8, center+8, center+8], fill='#ffff00', outline='#ff8800', width=2)
+
+    # Tick marks every 10 (2px each) above and below the horizon, on both sides
+    tick_ys = [center + i * 2 for i in range(-30, 31, 10) if i != 0]
+    tick_lines = [[x1, y, x2, y] for x1, x2 in ((80, 100), (300, 320)) for y in tick_ys]
+    draw_line = draw.line
+    for line in tick_lines:
+        draw_line(line, fill='#ffffff', width=2)
+
+    # Title
+    draw.text((center, 80), title, fill='#ffffff', anchor='mm')
+    draw.text((center, 320), subtitle, fill='#aaaaaa', anchor='mm')
+
+    if _save(img, filename):
+        print(f"Created {filename}")
+
+# Every gauge as (function, *args); each entry is independent, so they're
+# rendered in parallel across processes
+GAUGES = [
+    # Thrust and the standard gauges (white background with color zones) stay
+    # in one task so the body they share is only drawn once
+    (create_standard_color_gauges, STANDARD_GAUGES),
+    (create_fuel_gauge, 'images/fuel-gauge.png', 'FUEL', 'Energy Level'),
+    # Compass gauge (360° full circle)
+    (create_gauge, 'images/compass-gauge.png', 'compass', 'COMPASS', 'Direction'),
+    (create_horizon_gauge, 'images/horizon-gauge.png', 'HORIZON', 'Attitude'),
+]
+
+def _render_one(spec):
+    func, *args = spec
+    func(*args)
+    # Pool workers exit without running atexit hooks, so finish writing here
+    _flush_saves()
+
+if __name__ == '__main__':
+    # Create all gauge images
+    print("Generating gauge images...")
+
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(_render_one, GAUGES))
+
+    print("\nAll gauge images generated successfully!")
+    print("Images are saved in the 'images' folder")